@@ -0,0 +1,29 @@
+# Copyright (C) 2023 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Shared plugin logger.
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+
+__all__ = ["logger"]
+
+# Single logger shared by every module in the plugin. The log messages
+# already carry the configuration tree path for context, so per-module
+# logger names add little, and resolving one logger here avoids a
+# logging manager lock round trip in every module at import time.
+logger = getLogger("buildarr_sonarr")
@@ -18,6 +18,7 @@ Application API functions.
 
 from __future__ import annotations
 
+import atexit
 import logging
 
 from contextlib import contextmanager
@@ -29,14 +30,36 @@ import requests
 from buildarr.state import state
 from sonarr import ApiClient, Configuration
 
+from ._logging import logger
 from .exceptions import SonarrAPIError
 
 if TYPE_CHECKING:
-    from typing import Any, Generator, Optional, Union
+    from typing import Any, Dict, Generator, Optional, Tuple, Union
 
     from .secrets import SonarrSecrets
 
-logger = logging.getLogger(__name__)
+
+# Cache of API client objects, keyed per instance (host URL and API key).
+# Each client holds a keep-alive connection pool, so sharing one client
+# per instance across all operations avoids setting up a new connection
+# (and performing the TLS handshake) for every API call in a run.
+# Clients live for the duration of the process.
+_api_client_cache: Dict[Tuple[Optional[str], Optional[str]], ApiClient] = {}
+
+# Size of the keep-alive connection pool held by each cached API client.
+# Sized to cover the maximum number of requests the update thread pools
+# dispatch to one instance concurrently, so no request has to block
+# waiting for (or open outside of) a pooled connection.
+CONNECTION_POOL_MAXSIZE = 16
+
+
+def _close_api_clients() -> None:
+    for api_client in _api_client_cache.values():
+        api_client.close()
+    _api_client_cache.clear()
+
+
+atexit.register(_close_api_clients)
 
 
 @contextmanager
@@ -47,7 +70,10 @@ def sonarr_api_client(
     api_key: Optional[str] = None,
 ) -> Generator[ApiClient, None, None]:
     """
-    Create a Sonarr API client object, and make it available within a context.
+    Make a Sonarr API client object available within a context.
+
+    The client for each instance is created on first use and reused
+    (along with its connections) by subsequent contexts for that instance.
 
     Args:
         secrets (Optional[SonarrSecrets], optional): Instance secrets. Defaults to `None`.
@@ -57,25 +83,35 @@ def sonarr_api_client(
         Sonarr API client object
     """
 
-    configuration = Configuration(
-        host=secrets.host_url if secrets else host_url,
-        request_timeout=state.request_timeout,
-    )
-
-    root_logger = logging.getLogger()
-    configuration.logger_format = cast(
-        str,
-        cast(logging.Formatter, root_logger.handlers[0].formatter)._fmt,
+    cache_key = (
+        secrets.host_url if secrets else host_url,
+        secrets.api_key.get_secret_value() if secrets else api_key,
     )
-    configuration.debug = logging.getLevelName(root_logger.level) == "DEBUG"
-
-    if secrets:
-        configuration.api_key["X-Api-Key"] = secrets.api_key.get_secret_value()
-    elif api_key:
-        configuration.api_key["X-Api-Key"] = api_key
-
-    with ApiClient(configuration) as api_client:
-        yield api_client
+    api_client = _api_client_cache.get(cache_key)
+
+    if api_client is None:
+        configuration = Configuration(
+            host=secrets.host_url if secrets else host_url,
+            request_timeout=state.request_timeout,
+        )
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+
+        root_logger = logging.getLogger()
+        configuration.logger_format = cast(
+            str,
+            cast(logging.Formatter, root_logger.handlers[0].formatter)._fmt,
+        )
+        configuration.debug = logging.getLevelName(root_logger.level) == "DEBUG"
+
+        if secrets:
+            configuration.api_key["X-Api-Key"] = secrets.api_key.get_secret_value()
+        elif api_key:
+            configuration.api_key["X-Api-Key"] = api_key
+
+        api_client = ApiClient(configuration)
+        _api_client_cache[cache_key] = api_client
+
+    yield api_client
 
 
 def api_get(
@@ -26,10 +26,6 @@ from urllib.parse import urlparse
 
 import click
 
-from .config import SonarrInstanceConfig
-from .manager import SonarrManager
-from .secrets import SonarrSecrets
-
 if TYPE_CHECKING:
     from urllib.parse import ParseResult as Url
 
@@ -69,6 +65,13 @@ def dump_config(url: Url, api_key: str) -> int:
     The configuration is dumped to standard output in Buildarr-compatible YAML format.
     """
 
+    # Import on invocation, so that registering the command group
+    # (which Buildarr does for every installed plugin at CLI startup)
+    # does not pull in the plugin's configuration models and API client.
+    from .config import SonarrInstanceConfig
+    from .manager import SonarrManager
+    from .secrets import SonarrSecrets
+
     protocol = url.scheme
     hostname_port = url.netloc.split(":", 1)
     hostname = hostname_port[0]
@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from buildarr.config import ConfigPlugin
 from buildarr.types import NonEmptyStr, Port
-from pydantic import validator
+from pydantic import Field, PrivateAttr, validator
 from typing_extensions import Self
 
 from ..types import ArrApiKey, SonarrProtocol
@@ -147,7 +147,7 @@ class SonarrInstanceConfig(_SonarrInstanceConfig):
     The default Docker image URI to use when generating a Docker Compose file.
     """
 
-    settings: SonarrSettings = SonarrSettings()
+    settings: SonarrSettings = Field(default_factory=SonarrSettings)
     """
     Sonarr application settings.
 
@@ -158,15 +158,38 @@ class SonarrInstanceConfig(_SonarrInstanceConfig):
     def validate_url_base(cls, value: Optional[str]) -> Optional[str]:
         return f"/{value.strip('/')}" if value and value.strip("/") else None
 
+    _uses_trash_metadata: Optional[bool] = PrivateAttr(None)
+
     def uses_trash_metadata(self) -> bool:
-        if self.settings.quality.uses_trash_metadata():
-            return True
-        if self.settings.custom_formats.uses_trash_metadata():
-            return True
-        return False
+        # Checked by Buildarr before fetching the TRaSH metadata,
+        # and again when rendering the configuration, so cache the result.
+        if self._uses_trash_metadata is None:
+            self._uses_trash_metadata = (
+                self.settings.quality.uses_trash_metadata()
+                or self.settings.custom_formats.uses_trash_metadata()
+            )
+        return self._uses_trash_metadata
 
     def post_init_render(self, secrets: SonarrSecrets) -> Self:
-        copy = self.copy(deep=True)
+        # When no TRaSH metadata is used and no quality profile scores
+        # custom formats, rendering would not change anything, so skip
+        # the copy and the render altogether.
+        if not self.uses_trash_metadata() and not any(
+            profile.custom_formats
+            for profile in self.settings.profiles.quality_profiles.definitions.values()
+        ):
+            return self
+        # Shallow-copy the configuration tree, and deep-copy only the branches
+        # that `_post_init_render` mutates, so all other sections are shared
+        # with the original object instead of being rebuilt field-by-field.
+        copy = self.copy()
+        copy.settings = self.settings.copy()
+        copy.settings.quality = self.settings.quality.copy(deep=True)
+        copy.settings.custom_formats = self.settings.custom_formats.copy(deep=True)
+        copy.settings.profiles = self.settings.profiles.copy()
+        copy.settings.profiles.quality_profiles = self.settings.profiles.quality_profiles.copy(
+            deep=True,
+        )
         copy._post_init_render(secrets=secrets)
         return copy
 
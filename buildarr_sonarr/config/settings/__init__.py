@@ -18,8 +18,10 @@ Instance settings configuration.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from pydantic import Field
 from typing_extensions import Self
 
 from ..types import SonarrConfigBase
@@ -35,24 +37,75 @@ from .tags import SonarrTagsSettings
 from .ui import SonarrUISettings
 
 if TYPE_CHECKING:
+    from typing import Tuple
+
     from ...secrets import SonarrSecrets
 
+# Maximum number of threads used to update independent sections concurrently.
+MAX_SECTION_WORKERS = 4
+
 
 class SonarrSettings(SonarrConfigBase):
-    media_management: SonarrMediaManagementSettings = (
-        SonarrMediaManagementSettings()  # type: ignore[call-arg]
+    # Use `default_factory` for the section defaults, so Pydantic constructs
+    # fresh objects on demand instead of deep-copying (and re-validating)
+    # a shared default instance on every model instantiation.
+    media_management: SonarrMediaManagementSettings = Field(
+        default_factory=SonarrMediaManagementSettings,
+    )
+    profiles: SonarrProfilesSettings = Field(default_factory=SonarrProfilesSettings)
+    quality: SonarrQualitySettings = Field(default_factory=SonarrQualitySettings)
+    custom_formats: SonarrCustomFormatsSettings = Field(
+        default_factory=SonarrCustomFormatsSettings,
+    )
+    indexers: SonarrIndexersSettings = Field(default_factory=SonarrIndexersSettings)
+    download_clients: SonarrDownloadClientsSettings = Field(
+        default_factory=SonarrDownloadClientsSettings,
     )
-    profiles: SonarrProfilesSettings = SonarrProfilesSettings()
-    quality: SonarrQualitySettings = SonarrQualitySettings()
-    custom_formats: SonarrCustomFormatsSettings = SonarrCustomFormatsSettings()
-    indexers: SonarrIndexersSettings = SonarrIndexersSettings()  # type: ignore[call-arg]
-    download_clients: SonarrDownloadClientsSettings = SonarrDownloadClientsSettings()
     # TODO: Enable import lists.
-    # lists: SonarrListsSettings = SonarrListsSettings()
-    metadata: SonarrMetadataSettings = SonarrMetadataSettings()
-    tags: SonarrTagsSettings = SonarrTagsSettings()
-    general: SonarrGeneralSettings = SonarrGeneralSettings()
-    ui: SonarrUISettings = SonarrUISettings()
+    # lists: SonarrListsSettings = Field(default_factory=SonarrListsSettings)
+    metadata: SonarrMetadataSettings = Field(default_factory=SonarrMetadataSettings)
+    tags: SonarrTagsSettings = Field(default_factory=SonarrTagsSettings)
+    general: SonarrGeneralSettings = Field(default_factory=SonarrGeneralSettings)
+    ui: SonarrUISettings = Field(default_factory=SonarrUISettings)
+
+    # Section update ordering constraints:
+    # 1. Tags must be created before everything else.
+    # 2. Qualities and custom formats must be updated before quality profiles.
+    # 3. Download clients must be created before indexers.
+    # Sections within the same wave are independent of each other,
+    # and are processed concurrently. Later waves only start once the
+    # previous wave has completely finished.
+    _update_waves: Tuple[Tuple[str, ...], ...] = (
+        ("tags",),
+        (
+            "quality",
+            "custom_formats",
+            "download_clients",
+            "media_management",
+            # "lists",
+            "metadata",
+            "general",
+            "ui",
+        ),
+        ("indexers", "profiles"),
+    )
+
+    # Section deletion ordering constraints (reverse topology of updates):
+    # 1. Indexers must be deleted before download clients.
+    # 2. Quality profiles must be deleted before qualities and custom formats.
+    _delete_waves: Tuple[Tuple[str, ...], ...] = (
+        (
+            "profiles",
+            "indexers",
+            "media_management",
+            # "lists",
+            "tags",
+            "metadata",
+            "general",
+            "ui",
+        ),
+        ("download_clients", "custom_formats", "quality"),
+    )
 
     def update_remote(
         self,
@@ -61,112 +114,40 @@ class SonarrSettings(SonarrConfigBase):
         remote: Self,
         check_unmanaged: bool = False,
     ) -> bool:
-        # Overload base function to guarantee execution order of section updates.
-        # 1. Tags must be created before everything else.
-        # 2. Qualities must be updated before quality profiles.
-        # 3. Download clients must be created before indexers.
-        return any(
-            [
-                self.tags.update_remote(
-                    tree=f"{tree}.tags",
-                    secrets=secrets,
-                    remote=remote.tags,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.quality.update_remote(
-                    tree=f"{tree}.quality",
-                    secrets=secrets,
-                    remote=remote.quality,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.custom_formats.update_remote(
-                    tree=f"{tree}.custom_formats",
-                    secrets=secrets,
-                    remote=remote.custom_formats,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.download_clients.update_remote(
-                    tree=f"{tree}.download_clients",
-                    secrets=secrets,
-                    remote=remote.download_clients,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.indexers.update_remote(
-                    tree=f"{tree}.indexers",
-                    secrets=secrets,
-                    remote=remote.indexers,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.media_management.update_remote(
-                    tree=f"{tree}.media_management",
-                    secrets=secrets,
-                    remote=remote.media_management,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.profiles.update_remote(
-                    tree=f"{tree}.profiles",
-                    secrets=secrets,
-                    remote=remote.profiles,
-                    check_unmanaged=check_unmanaged,
-                ),
-                # self.lists.update_remote(
-                #     tree=f"{tree}.lists",
-                #     secrets=secrets,
-                #     remote=remote.lists,
-                #     check_unmanaged=check_unmanaged,
-                # ),
-                self.metadata.update_remote(
-                    tree=f"{tree}.metadata",
-                    secrets=secrets,
-                    remote=remote.metadata,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.general.update_remote(
-                    tree=f"{tree}.general",
-                    secrets=secrets,
-                    remote=remote.general,
-                    check_unmanaged=check_unmanaged,
-                ),
-                self.ui.update_remote(
-                    tree=f"{tree}.ui",
-                    secrets=secrets,
-                    remote=remote.ui,
-                    check_unmanaged=check_unmanaged,
-                ),
-            ],
-        )
+        # Overload base function to guarantee execution order of section updates
+        # (as declared in `_update_waves`), while processing sections with
+        # no ordering relationship between each other concurrently.
+        # Section updates are I/O bound (HTTP requests to the remote instance),
+        # so overlapping them hides most of the round-trip latency.
+        changed = False
+        with ThreadPoolExecutor(max_workers=MAX_SECTION_WORKERS) as executor:
+            for wave in self._update_waves:
+                for wave_changed in executor.map(
+                    lambda section_name: getattr(self, section_name).update_remote(
+                        tree=f"{tree}.{section_name}",
+                        secrets=secrets,
+                        remote=getattr(remote, section_name),
+                        check_unmanaged=check_unmanaged,
+                    ),
+                    wave,
+                ):
+                    changed |= wave_changed
+        return changed
 
     def delete_remote(self, tree: str, secrets: SonarrSecrets, remote: Self) -> bool:
-        # Overload base function to guarantee execution order of section deletions.
-        # 1. Indexers must be deleted before download clients.
-        return any(
-            [
-                self.profiles.delete_remote(f"{tree}.profiles", secrets, remote.profiles),
-                self.indexers.delete_remote(f"{tree}.indexers", secrets, remote.indexers),
-                self.download_clients.delete_remote(
-                    tree=f"{tree}.download_clients",
-                    secrets=secrets,
-                    remote=remote.download_clients,
-                ),
-                self.media_management.delete_remote(
-                    tree=f"{tree}.media_management",
-                    secrets=secrets,
-                    remote=remote.media_management,
-                ),
-                # self.lists.delete_remote(
-                #     tree=f"{tree}.lists",
-                #     secrets=secrets,
-                #     remote=remote.lists,
-                # ),
-                self.tags.delete_remote(f"{tree}.tags", secrets, remote.tags),
-                self.custom_formats.delete_remote(
-                    tree=f"{tree}.custom_formats",
-                    secrets=secrets,
-                    remote=remote.custom_formats,
-                ),
-                self.quality.delete_remote(f"{tree}.quality", secrets, remote.quality),
-                self.metadata.delete_remote(f"{tree}.metadata", secrets, remote.metadata),
-                self.general.delete_remote(f"{tree}.general", secrets, remote.general),
-                self.ui.delete_remote(f"{tree}.ui", secrets, remote.ui),
-            ],
-        )
+        # Overload base function to guarantee execution order of section deletions
+        # (as declared in `_delete_waves`), processing independent sections
+        # concurrently in the same way as `update_remote`.
+        changed = False
+        with ThreadPoolExecutor(max_workers=MAX_SECTION_WORKERS) as executor:
+            for wave in self._delete_waves:
+                for wave_changed in executor.map(
+                    lambda section_name: getattr(self, section_name).delete_remote(
+                        tree=f"{tree}.{section_name}",
+                        secrets=secrets,
+                        remote=getattr(remote, section_name),
+                    ),
+                    wave,
+                ):
+                    changed |= wave_changed
+        return changed
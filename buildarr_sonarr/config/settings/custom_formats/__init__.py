@@ -18,20 +18,19 @@ Custom format settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import sonarr
 
+from pydantic import PrivateAttr
 from typing_extensions import Self
 
+from ...._logging import logger
 from ....api import api_get, sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
 from .custom_format import CustomFormat
 
-logger = getLogger(__name__)
-
 
 class SonarrCustomFormatsSettings(SonarrConfigBase):
     # Custom format settings configuration.
@@ -46,11 +45,17 @@ class SonarrCustomFormatsSettings(SonarrConfigBase):
     Define download clients under this attribute.
     """
 
+    _uses_trash_metadata: Optional[bool] = PrivateAttr(None)
+
     def uses_trash_metadata(self) -> bool:
-        for customformat in self.definitions.values():
-            if customformat.uses_trash_metadata():
-                return True
-        return False
+        # This gets checked multiple times over a single run
+        # (once by Buildarr itself, then again when rendering),
+        # so cache the result instead of walking the definitions each time.
+        if self._uses_trash_metadata is None:
+            self._uses_trash_metadata = any(
+                customformat.uses_trash_metadata() for customformat in self.definitions.values()
+            )
+        return self._uses_trash_metadata
 
     def _post_init_render(self, secrets: SonarrSecrets) -> None:
         with sonarr_api_client(secrets=secrets) as api_client:
@@ -18,9 +18,6 @@ Custom format definition configuration.
 
 from __future__ import annotations
 
-import json
-
-from logging import getLogger
 from typing import Any, Dict, List, Optional, Union, cast
 
 import sonarr
@@ -31,9 +28,11 @@ from buildarr.types import TrashID
 from pydantic import Field
 from typing_extensions import Annotated, Self
 
+from ...._logging import logger
 from ....api import sonarr_api_client
 from ....exceptions import SonarrConfigUnsupportedError
 from ....secrets import SonarrSecrets
+from ....util import load_json_file
 from ...types import SonarrConfigBase
 from .conditions.edition import EditionCondition
 from .conditions.indexer_flag import IndexerFlagCondition
@@ -45,8 +44,6 @@ from .conditions.resolution import ResolutionCondition
 from .conditions.size import SizeCondition
 from .conditions.source import SourceCondition
 
-logger = getLogger(__name__)
-
 ConditionType = Union[
     EditionCondition,
     IndexerFlagCondition,
@@ -150,48 +147,43 @@ class CustomFormat(SonarrConfigBase):
         for customformat_file in (
             state.trash_metadata_dir / "docs" / "json" / "sonarr" / "cf"
         ).iterdir():
-            with customformat_file.open() as f:
-                trash_customformat = json.load(f)
-                if cast(str, trash_customformat["trash_id"]).lower() == self.trash_id:
-                    if "default_score" not in self.model_fields_set:
+            trash_customformat = load_json_file(customformat_file)
+            if cast(str, trash_customformat["trash_id"]).lower() == self.trash_id:
+                if "default_score" not in self.model_fields_set:
+                    try:
+                        self.default_score = trash_customformat.get("trash_scores", {})["default"]
+                    except KeyError:
+                        pass
+                for trash_condition in trash_customformat["specifications"]:
+                    condition_name = trash_condition["name"]
+                    if condition_name not in self.conditions:
+                        api_condition_dict: Dict[str, Any] = {
+                            **trash_condition,
+                            "fields": [
+                                {"name": name, "value": value}
+                                for name, value in trash_condition["fields"].items()
+                            ],
+                        }
+                        condition_implementation: str = api_condition_dict["implementation"]
                         try:
-                            self.default_score = trash_customformat.get("trash_scores", {})[
-                                "default"
-                            ]
+                            condition_type = CONDITION_TYPE_MAP[condition_implementation]
                         except KeyError:
-                            pass
-                    for trash_condition in trash_customformat["specifications"]:
-                        condition_name = trash_condition["name"]
-                        if condition_name not in self.conditions:
-                            api_condition_dict: Dict[str, Any] = {
-                                **trash_condition,
-                                "fields": [
-                                    {"name": name, "value": value}
-                                    for name, value in trash_condition["fields"].items()
-                                ],
-                            }
-                            condition_implementation: str = api_condition_dict["implementation"]
-                            try:
-                                condition_type = CONDITION_TYPE_MAP[condition_implementation]
-                            except KeyError:
-                                raise SonarrConfigUnsupportedError(
-                                    (
-                                        f"Unsupported condition '{condition_name}' "
-                                        f"with implementation '{condition_implementation}' "
-                                        f"found in dynamic custom format '{customformat_name}' "
-                                        f"(trash_id='{self.trash_id}')"
-                                    ),
-                                ) from None
-                            self.conditions[condition_name] = condition_type._from_remote(  # type: ignore[attr-defined]
-                                api_schema_dict=api_condition_schema_dicts[
-                                    condition_implementation
-                                ],
-                                api_condition=sonarr.CustomFormatSpecificationSchema.from_dict(
-                                    api_condition_dict,
+                            raise SonarrConfigUnsupportedError(
+                                (
+                                    f"Unsupported condition '{condition_name}' "
+                                    f"with implementation '{condition_implementation}' "
+                                    f"found in dynamic custom format '{customformat_name}' "
+                                    f"(trash_id='{self.trash_id}')"
                                 ),
-                            )
-                    self.delete_unmanaged_conditions = True
-                    return
+                            ) from None
+                        self.conditions[condition_name] = condition_type._from_remote(  # type: ignore[attr-defined]
+                            api_schema_dict=api_condition_schema_dicts[condition_implementation],
+                            api_condition=sonarr.CustomFormatSpecificationSchema.from_dict(
+                                api_condition_dict,
+                            ),
+                        )
+                self.delete_unmanaged_conditions = True
+                return
         raise ConfigTrashIDNotFoundError(
             f"Unable to find Sonarr custom format profile with trash ID '{self.trash_id}'",
         )
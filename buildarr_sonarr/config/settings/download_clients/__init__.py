@@ -18,14 +18,15 @@ Download client settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple, Union
 
 import sonarr
 
 from pydantic import Field
 from typing_extensions import Annotated, Self
 
+from ...._logging import logger
 from ....api import sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
@@ -47,7 +48,8 @@ from .usenet.nzbvortex import NzbvortexDownloadClient
 from .usenet.pneumatic import PneumaticDownloadClient
 from .usenet.sabnzbd import SabnzbdDownloadClient
 
-logger = getLogger(__name__)
+# Maximum number of threads used to mutate download clients concurrently.
+MAX_DEFINITION_WORKERS = 4
 
 DOWNLOADCLIENT_TYPE_MAP = {
     downloadclient_type._implementation: downloadclient_type  # type: ignore[attr-defined]
@@ -144,9 +146,21 @@ class SonarrDownloadClientsSettings(SonarrConfigBase):
         # Track whether or not any changes have been made on the remote instance.
         changed = False
         # Pull API objects and metadata required during the update operation.
+        # The API client is kept open for the mutations below, so they all
+        # reuse the same connection instead of setting up a new one per call.
         with sonarr_api_client(secrets=secrets) as api_client:
             downloadclient_api = sonarr.DownloadClientApi(api_client)
-            api_downloadclient_schemas = downloadclient_api.list_download_client_schema()
+            # Index the API schemas by lowercased implementation name up-front,
+            # so creating each download client is a dict lookup instead of a
+            # linear search (and schema dict conversion) over all schemas.
+            api_downloadclient_schemas: Dict[str, Dict[str, Any]] = {
+                api_schema.implementation.lower(): {
+                    key: value
+                    for key, value in api_schema.to_dict().items()
+                    if key not in ("id", "name")
+                }
+                for api_schema in downloadclient_api.list_download_client_schema()
+            }
             api_downloadclients = {
                 api_downloadclient.name: api_downloadclient
                 for api_downloadclient in downloadclient_api.list_download_client()
@@ -157,29 +171,39 @@ class SonarrDownloadClientsSettings(SonarrConfigBase):
                 or any(downloadclient.tags for downloadclient in remote.definitions.values())
                 else {}
             )
-        # Compare local definitions to their remote equivalent.
-        # If a local definition does not exist on the remote, create it.
-        # If it does exist on the remote, attempt an an in-place modification,
-        # and set the `changed` flag if modifications were made.
-        for downloadclient_name, downloadclient in self.definitions.items():
-            downloadclient_tree = f"{tree}.definitions[{downloadclient_name!r}]"
-            if downloadclient_name not in remote.definitions:
-                downloadclient._create_remote(
+
+            # Compare a local definition to its remote equivalent.
+            # If it does not exist on the remote, create it.
+            # If it does exist on the remote, attempt an in-place modification,
+            # and return whether or not modifications were made.
+            def update_downloadclient(definition: Tuple[str, DownloadClientType]) -> bool:
+                downloadclient_name, downloadclient = definition
+                downloadclient_tree = f"{tree}.definitions[{downloadclient_name!r}]"
+                if downloadclient_name not in remote.definitions:
+                    downloadclient._create_remote(
+                        tree=downloadclient_tree,
+                        api_client=api_client,
+                        api_downloadclient_schemas=api_downloadclient_schemas,
+                        tag_ids=tag_ids,
+                        downloadclient_name=downloadclient_name,
+                    )
+                    return True
+                return downloadclient._update_remote(
                     tree=downloadclient_tree,
-                    secrets=secrets,
-                    api_downloadclient_schemas=api_downloadclient_schemas,
+                    api_client=api_client,
+                    remote=remote.definitions[downloadclient_name],  # type: ignore[arg-type]
                     tag_ids=tag_ids,
-                    downloadclient_name=downloadclient_name,
+                    api_downloadclient=api_downloadclients[downloadclient_name],
                 )
-                changed = True
-            elif downloadclient._update_remote(
-                tree=downloadclient_tree,
-                secrets=secrets,
-                remote=remote.definitions[downloadclient_name],  # type: ignore[arg-type]
-                tag_ids=tag_ids,
-                api_downloadclient=api_downloadclients[downloadclient_name],
-            ):
-                changed = True
+
+            # Download clients are independent of each other, so process them
+            # concurrently (the mutations are I/O bound HTTP requests).
+            with ThreadPoolExecutor(max_workers=MAX_DEFINITION_WORKERS) as executor:
+                for downloadclient_changed in executor.map(
+                    update_downloadclient,
+                    self.definitions.items(),
+                ):
+                    changed |= downloadclient_changed
         # Return whether or not the remote instance was changed.
         return changed
 
@@ -187,6 +211,8 @@ class SonarrDownloadClientsSettings(SonarrConfigBase):
         # Track whether or not any changes have been made on the remote instance.
         changed = False
         # Pull API objects and metadata required during the update operation.
+        # The API client is kept open for the deletions below, so they all
+        # reuse the same connection instead of setting up a new one per call.
         with sonarr_api_client(secrets=secrets) as api_client:
             downloadclient_ids: Dict[str, int] = {
                 api_downloadclient.name: api_downloadclient.id
@@ -194,22 +220,22 @@ class SonarrDownloadClientsSettings(SonarrConfigBase):
                     api_client,
                 ).list_download_client()
             }
-        # Traverse the remote definitions, and see if there are any remote definitions
-        # that do not exist in the local configuration.
-        # If `delete_unmanaged` is enabled, delete it from the remote.
-        # If `delete_unmanaged` is disabled, just add a log entry acknowledging
-        # the existence of the unmanaged definition.
-        for downloadclient_name, downloadclient in remote.definitions.items():
-            if downloadclient_name not in self.definitions:
-                downloadclient_tree = f"{tree}.definitions[{downloadclient_name!r}]"
-                if self.delete_unmanaged:
-                    logger.info("%s: (...) -> (deleted)", downloadclient_tree)
-                    downloadclient._delete_remote(
-                        secrets=secrets,
-                        downloadclient_id=downloadclient_ids[downloadclient_name],
-                    )
-                    changed = True
-                else:
-                    logger.debug("%s: (...) (unmanaged)", downloadclient_tree)
+            # Traverse the remote definitions, and see if there are any remote definitions
+            # that do not exist in the local configuration.
+            # If `delete_unmanaged` is enabled, delete it from the remote.
+            # If `delete_unmanaged` is disabled, just add a log entry acknowledging
+            # the existence of the unmanaged definition.
+            for downloadclient_name, downloadclient in remote.definitions.items():
+                if downloadclient_name not in self.definitions:
+                    downloadclient_tree = f"{tree}.definitions[{downloadclient_name!r}]"
+                    if self.delete_unmanaged:
+                        logger.info("%s: (...) -> (deleted)", downloadclient_tree)
+                        downloadclient._delete_remote(
+                            api_client=api_client,
+                            downloadclient_id=downloadclient_ids[downloadclient_name],
+                        )
+                        changed = True
+                    else:
+                        logger.debug("%s: (...) (unmanaged)", downloadclient_tree)
         # Return whether or not the remote instance was changed.
         return changed
@@ -18,21 +18,41 @@ Download client configuration base class.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Any, Dict, List, Mapping, Set
+from functools import lru_cache, partial
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, List, Mapping, Tuple, Type
 
 import sonarr
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import NonEmptyStr
-from pydantic import PositiveInt
+from pydantic import Field, PositiveInt
 from typing_extensions import Self
 
-from ....api import sonarr_api_client
-from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
 
-logger = getLogger(__name__)
+# Cache of effective remote maps (base and subclass entries combined),
+# holding one entry per download client class: the map built for the most
+# recently seen tag ID mapping. The same tag ID mapping object is passed to
+# every download client within a single update run, so the remote map (and
+# its codec bindings) only needs to be built once per class for that run,
+# instead of being concatenated on every call. Each run fetches a fresh tag
+# ID mapping, so the entry is replaced — not accumulated — when the mapping
+# changes, keeping the cache bounded in long-lived daemon runs.
+_remote_map_cache: Dict[
+    Type[DownloadClient],
+    Tuple[Mapping[str, int], List[RemoteMapEntry]],
+] = {}
+
+
+# Module-level encoder/decoder functions for the tags attribute,
+# bound to the tag ID mapping using `functools.partial` in the remote map,
+# instead of allocating new closures every time the map is built.
+def _decode_tags(tag_names: Mapping[int, str], value: Iterable[int]) -> FrozenSet[str]:
+    return frozenset(tag_names[tag_id] for tag_id in value if tag_id in tag_names)
+
+
+def _encode_tags(tag_ids: Mapping[str, int], value: Iterable[str]) -> List[int]:
+    return sorted(tag_ids[tag] for tag in value)
 
 
 class DownloadClient(SonarrConfigBase):
@@ -61,7 +81,7 @@ class DownloadClient(SonarrConfigBase):
     Round-robin is used for clients with the same priority.
     """
 
-    tags: Set[NonEmptyStr] = set()
+    tags: FrozenSet[NonEmptyStr] = Field(default_factory=frozenset)
     """
     Sonarr tags to assign to the download clients.
     Only media under those tags will be assigned to this client.
@@ -69,12 +89,37 @@ class DownloadClient(SonarrConfigBase):
     If no tags are assigned, all media can use the client.
     """
 
-    _implementation: str
-    _remote_map: List[RemoteMapEntry] = []
+    _implementation: ClassVar[str]
+    _implementation_lc: ClassVar[str]
+    _remote_map: ClassVar[List[RemoteMapEntry]] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Pre-compute the lowercased implementation name used for API schema
+        # lookups, so it is not re-generated every time a client is created.
+        implementation = getattr(cls, "_implementation", None)
+        if implementation is not None:
+            cls._implementation_lc = implementation.lower()
+
+    class Config(SonarrConfigBase.Config):
+        # Download client definitions are never mutated in-place once parsed.
+        # Mark them immutable, and let validation share the already-parsed
+        # instance instead of shallow-copying it into the parent model,
+        # reducing allocations when large definition trees are constructed.
+        # (Pydantic v1 models do not support `__slots__`, so this is as close
+        # as the installed Pydantic version gets to a frozen/slotted model.)
+        allow_mutation = False
+        copy_on_model_validation = "none"
 
     @classmethod
-    def _get_base_remote_map(cls, tag_ids: Mapping[str, int]) -> List[RemoteMapEntry]:
-        return [
+    def _get_remote_map(cls, tag_ids: Mapping[str, int]) -> List[RemoteMapEntry]:
+        cached = _remote_map_cache.get(cls)
+        if cached is not None and cached[0] is tag_ids:
+            return cached[1]
+        # Invert the tag ID mapping once, so decoding a resource's tag IDs
+        # is a single lookup per tag instead of a scan over all known tags.
+        tag_names: Dict[int, str] = {tag_id: tag for tag, tag_id in tag_ids.items()}
+        remote_map: List[RemoteMapEntry] = [
             ("enable", "enable", {}),
             ("remove_completed_downloads", "removeCompletedDownloads", {}),
             ("remove_failed_downloads", "removeFailedDownloads", {}),
@@ -82,46 +127,39 @@ class DownloadClient(SonarrConfigBase):
                 "tags",
                 "tags",
                 {
-                    "decoder": lambda v: set(
-                        (tag for tag, tag_id in tag_ids.items() if tag_id in v),
-                    ),
-                    "encoder": lambda v: sorted(tag_ids[tag] for tag in v),
+                    "decoder": partial(_decode_tags, tag_names),
+                    # The tag sets are frozen (and therefore hashable),
+                    # so encoded output can be cached for the lifetime
+                    # of this remote map across clients sharing tag sets.
+                    "encoder": lru_cache(maxsize=None)(partial(_encode_tags, tag_ids)),
                 },
             ),
+            *cls._remote_map,
         ]
+        _remote_map_cache[cls] = (tag_ids, remote_map)
+        return remote_map
 
     @classmethod
     def _from_remote(cls, tag_ids: Mapping[str, int], remote_attrs: Mapping[str, Any]) -> Self:
         return cls(
             **cls.get_local_attrs(
-                cls._get_base_remote_map(tag_ids=tag_ids) + cls._remote_map,
+                cls._get_remote_map(tag_ids=tag_ids),
                 remote_attrs,
             ),
         )
 
-    def _get_api_schema(self, schemas: List[sonarr.DownloadClientResource]) -> Dict[str, Any]:
-        return {
-            k: v
-            for k, v in next(
-                s for s in schemas if s.implementation.lower() == self._implementation.lower()
-            )
-            .to_dict()
-            .items()
-            if k not in ["id", "name"]
-        }
-
     def _create_remote(
         self,
         tree: str,
-        secrets: SonarrSecrets,
-        api_downloadclient_schemas: List[sonarr.DownloadClientResource],
+        api_client: sonarr.ApiClient,
+        api_downloadclient_schemas: Mapping[str, Dict[str, Any]],
         tag_ids: Mapping[str, int],
         downloadclient_name: str,
     ) -> None:
-        api_schema = self._get_api_schema(api_downloadclient_schemas)
+        api_schema = api_downloadclient_schemas[self._implementation_lc]
         set_attrs = self.get_create_remote_attrs(
             tree=tree,
-            remote_map=self._get_base_remote_map(tag_ids=tag_ids) + self._remote_map,
+            remote_map=self._get_remote_map(tag_ids=tag_ids),
         )
         field_values: Dict[str, Any] = {
             field["name"]: field["value"] for field in set_attrs["fields"]
@@ -131,15 +169,14 @@ class DownloadClient(SonarrConfigBase):
             for f in api_schema["fields"]
         ]
         remote_attrs = {"name": downloadclient_name, **api_schema, **set_attrs}
-        with sonarr_api_client(secrets=secrets) as api_client:
-            sonarr.DownloadClientApi(api_client).create_download_client(
-                download_client_resource=sonarr.DownloadClientResource.from_dict(remote_attrs),
-            )
+        sonarr.DownloadClientApi(api_client).create_download_client(
+            download_client_resource=sonarr.DownloadClientResource.from_dict(remote_attrs),
+        )
 
     def _update_remote(
         self,
         tree: str,
-        secrets: SonarrSecrets,
+        api_client: sonarr.ApiClient,
         remote: Self,
         tag_ids: Mapping[str, int],
         api_downloadclient: sonarr.DownloadClientResource,
@@ -147,10 +184,13 @@ class DownloadClient(SonarrConfigBase):
         updated, updated_attrs = self.get_update_remote_attrs(
             tree=tree,
             remote=remote,
-            remote_map=self._get_base_remote_map(tag_ids=tag_ids) + self._remote_map,
+            remote_map=self._get_remote_map(tag_ids=tag_ids),
             set_unchanged=True,
         )
         if updated:
+            # Only convert the API object into a dictionary once,
+            # and use it for both the field list merge and the request body.
+            api_downloadclient_attrs = api_downloadclient.to_dict()
             if "fields" in updated_attrs:
                 updated_fields: Dict[str, Any] = {
                     field["name"]: field["value"] for field in updated_attrs["fields"]
@@ -161,19 +201,17 @@ class DownloadClient(SonarrConfigBase):
                         if f["name"] in updated_fields
                         else f
                     )
-                    for f in api_downloadclient.to_dict()["fields"]
+                    for f in api_downloadclient_attrs["fields"]
                 ]
-            remote_attrs = {**api_downloadclient.to_dict(), **updated_attrs}
-            with sonarr_api_client(secrets=secrets) as api_client:
-                sonarr.DownloadClientApi(api_client).update_download_client(
-                    id=str(api_downloadclient.id),
-                    download_client_resource=sonarr.DownloadClientResource.from_dict(
-                        remote_attrs,
-                    ),
-                )
+            remote_attrs = {**api_downloadclient_attrs, **updated_attrs}
+            sonarr.DownloadClientApi(api_client).update_download_client(
+                id=str(api_downloadclient.id),
+                download_client_resource=sonarr.DownloadClientResource.from_dict(
+                    remote_attrs,
+                ),
+            )
             return True
         return False
 
-    def _delete_remote(self, secrets: SonarrSecrets, downloadclient_id: int) -> None:
-        with sonarr_api_client(secrets=secrets) as api_client:
-            sonarr.DownloadClientApi(api_client).delete_download_client(id=downloadclient_id)
+    def _delete_remote(self, api_client: sonarr.ApiClient, downloadclient_id: int) -> None:
+        sonarr.DownloadClientApi(api_client).delete_download_client(id=downloadclient_id)
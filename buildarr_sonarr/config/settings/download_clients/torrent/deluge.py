@@ -18,7 +18,7 @@ Deluge download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password, Port
@@ -97,8 +97,8 @@ class DelugeDownloadClient(TorrentDownloadClient):
     When set to `true`, add releases to the download client in paused state.
     """
 
-    _implementation: str = "Deluge"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "Deluge"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
@@ -18,7 +18,7 @@ Flood download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional, Set
+from typing import ClassVar, List, Literal, Optional, Set
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password, Port
@@ -111,8 +111,8 @@ class FloodDownloadClient(TorrentDownloadClient):
     Add media to the download client in the Paused state.
     """
 
-    _implementation: str = "Flood"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "Flood"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
@@ -18,7 +18,7 @@ Freebox download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password, Port
@@ -103,8 +103,8 @@ class FreeboxDownloadClient(TorrentDownloadClient):
     Add media to the download client in the Paused state.
     """
 
-    _implementation: str = "TorrentFreeboxDownload"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "TorrentFreeboxDownload"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
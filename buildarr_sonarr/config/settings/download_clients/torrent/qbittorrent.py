@@ -18,7 +18,7 @@ qBittorrent download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Port
@@ -133,8 +133,8 @@ class QbittorrentDownloadClient(TorrentDownloadClient):
     Requires qBittorrent v4.1.0 or later.
     """
 
-    _implementation: str = "QBittorrent"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "QBittorrent"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
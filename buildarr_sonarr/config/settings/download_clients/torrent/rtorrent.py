@@ -18,7 +18,7 @@ RTorrent (ruTorrent) download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password, Port
@@ -127,8 +127,8 @@ class RtorrentDownloadClient(TorrentDownloadClient):
     This may break magnet files.
     """
 
-    _implementation: str = "RTorrent"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "RTorrent"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
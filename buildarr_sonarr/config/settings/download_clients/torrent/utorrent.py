@@ -18,7 +18,7 @@ uTorrent download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password, Port
@@ -117,8 +117,8 @@ class UtorrentDownloadClient(TorrentDownloadClient):
     Initial state for torrents added to uTorrent.
     """
 
-    _implementation: str = "UTorrent"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "UTorrent"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
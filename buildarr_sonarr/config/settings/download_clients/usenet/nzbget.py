@@ -18,16 +18,13 @@ NZBGet download client configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password, Port
 
 from .base import UsenetDownloadClient
 
-logger = getLogger(__name__)
-
 
 class NzbgetPriority(BaseEnum):
     verylow = -100
@@ -119,8 +116,8 @@ class NzbgetDownloadClient(UsenetDownloadClient):
     This option requires NZBGet version 16.0 or later.
     """
 
-    _implementation: str = "Nzbget"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "Nzbget"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
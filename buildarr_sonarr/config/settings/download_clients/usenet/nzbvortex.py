@@ -18,7 +18,7 @@ NZBVortex download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password, Port
@@ -90,8 +90,8 @@ class NzbvortexDownloadClient(UsenetDownloadClient):
     * `high`
     """
 
-    _implementation: str = "NzbVortex"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "NzbVortex"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         (
@@ -18,7 +18,7 @@ SABnzbd download client configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Port
@@ -115,8 +115,8 @@ class SabnzbdDownloadClient(UsenetDownloadClient):
     * `force`
     """
 
-    _implementation: str = "Sabnzbd"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "Sabnzbd"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("hostname", "host", {"is_field": True}),
         ("port", "port", {"is_field": True}),
         ("use_ssl", "useSsl", {"is_field": True}),
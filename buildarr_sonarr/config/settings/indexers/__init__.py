@@ -18,8 +18,7 @@ Indexer settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Dict, List, Union
+from typing import ClassVar, Dict, List, Union
 
 import sonarr
 
@@ -27,6 +26,7 @@ from buildarr.config import RemoteMapEntry
 from pydantic import Field
 from typing_extensions import Annotated, Self
 
+from ...._logging import logger
 from ....api import sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
@@ -40,8 +40,6 @@ from .torrent.torrentpotato import TorrentpotatoIndexer
 from .torrent.torznab import TorznabIndexer
 from .usenet.newznab import NewznabIndexer
 
-logger = getLogger(__name__)
-
 INDEXER_TYPE_MAP = {
     indexer_type._implementation: indexer_type  # type: ignore[attr-defined]
     for indexer_type in (
@@ -162,7 +160,7 @@ class SonarrIndexersSettings(SonarrConfigBase):
     Indexers to manage via Buildarr are defined here.
     """
 
-    _remote_map: List[RemoteMapEntry] = [
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("minimum_age", "minimumAge", {}),
         ("retention", "retention", {}),
         ("maximum_size", "maximumSize", {}),
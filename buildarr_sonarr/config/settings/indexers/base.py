@@ -18,8 +18,7 @@ Indexer configuration base class.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Any, Dict, List, Mapping, Optional, Set
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Set
 
 import sonarr
 
@@ -33,8 +32,6 @@ from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
 from ...util import language_parse
 
-logger = getLogger(__name__)
-
 
 class Indexer(SonarrConfigBase):
     # Indexer configuration base class.
@@ -84,8 +81,8 @@ class Indexer(SonarrConfigBase):
     If unset, monitor all releases using this indexer.
     """
 
-    _implementation: str
-    _remote_map: List[RemoteMapEntry] = []
+    _implementation: ClassVar[str]
+    _remote_map: ClassVar[List[RemoteMapEntry]] = []
 
     @validator("multi_languages")
     def validate_multi_languages(cls, value: Set[str]) -> Set[str]:
@@ -98,6 +95,9 @@ class Indexer(SonarrConfigBase):
         downloadclient_ids: Mapping[str, int],
         tag_ids: Mapping[str, int],
     ) -> List[RemoteMapEntry]:
+        # Invert the tag ID mapping once, so decoding a resource's tag IDs
+        # is a single lookup per tag instead of a scan over all known tags.
+        tag_names: Dict[int, str] = {tag_id: tag for tag, tag_id in tag_ids.items()}
         return [
             ("enable_rss", "enableRss", {}),
             ("enable_automatic_search", "enableAutomaticSearch", {}),
@@ -128,7 +128,7 @@ class Indexer(SonarrConfigBase):
                 "tags",
                 "tags",
                 {
-                    "decoder": lambda v: [tag for tag, tag_id in tag_ids.items() if tag_id in v],
+                    "decoder": lambda v: [tag_names[tag_id] for tag_id in v if tag_id in tag_names],
                     "encoder": lambda v: [tag_ids[tag] for tag in v],
                 },
             ),
@@ -266,6 +266,9 @@ class Indexer(SonarrConfigBase):
             ),
         )
         if updated:
+            # Only convert the API object into a dictionary once,
+            # and use it for both the field list merge and the request body.
+            api_indexer_attrs = api_indexer.to_dict()
             if "fields" in updated_attrs:
                 updated_fields: Dict[str, Any] = {
                     field["name"]: field["value"] for field in updated_attrs["fields"]
@@ -276,9 +279,9 @@ class Indexer(SonarrConfigBase):
                         if f["name"] in updated_fields
                         else f
                     )
-                    for f in api_indexer.to_dict()["fields"]
+                    for f in api_indexer_attrs["fields"]
                 ]
-            remote_attrs = {**api_indexer.to_dict(), **updated_attrs}
+            remote_attrs = {**api_indexer_attrs, **updated_attrs}
             with sonarr_api_client(secrets=secrets) as api_client:
                 sonarr.IndexerApi(api_client).update_indexer(
                     id=str(api_indexer.id),
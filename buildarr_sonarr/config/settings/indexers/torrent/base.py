@@ -18,7 +18,6 @@ Torrent indexer configuration base class.
 
 from __future__ import annotations
 
-from logging import getLogger
 from typing import List, Mapping, Optional, Set
 
 import sonarr
@@ -29,8 +28,6 @@ from pydantic import PositiveInt, validator
 
 from ..base import Indexer
 
-logger = getLogger(__name__)
-
 
 class TorrentIndexer(Indexer):
     # Configuration attributes common to all torrent indexers.
@@ -18,7 +18,7 @@ BroacasTheNet indexer configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal
+from typing import ClassVar, List, Literal
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import Password
@@ -47,10 +47,10 @@ class BroadcasthenetIndexer(TorrentIndexer):
     BroadcasTheNet API key.
     """
 
-    _implementation = "BroadcastheNet"
-    _implementation_name = "BroadcasTheNet"
-    _config_contract = "BroadcastheNetSettings"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "BroadcastheNet"
+    _implementation_name: ClassVar[str] = "BroadcasTheNet"
+    _config_contract: ClassVar[str] = "BroadcastheNetSettings"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("api_url", "apiUrl", {"is_field": True}),
         ("api_key", "apiKey", {"is_field": True}),
     ]
@@ -18,7 +18,7 @@ FileList.io indexer configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal, Set
+from typing import ClassVar, Iterable, List, Literal, Set
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Password
@@ -40,6 +40,10 @@ class FilelistCategory(BaseEnum):
     SPORT = "Sport"
 
 
+def _encode_categories(value: Iterable[FilelistCategory]) -> List[str]:
+    return sorted(category.value for category in value)
+
+
 class FilelistIndexer(TorrentIndexer):
     # Monitor for new releases on FileList.io.
 
@@ -102,8 +106,8 @@ class FilelistIndexer(TorrentIndexer):
     * `Sport`
     """
 
-    _implementation = "FileList"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "FileList"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("base_url", "baseUrl", {"is_field": True}),
         ("username", "username", {"is_field": True}),
         ("passkey", "passKey", {"is_field": True}),
@@ -111,6 +115,6 @@ class FilelistIndexer(TorrentIndexer):
         (
             "anime_categories",
             "animeCategories",
-            {"is_field": True, "encoder": lambda v: sorted(c.value for c in v)},
+            {"is_field": True, "encoder": _encode_categories},
         ),
     ]
@@ -18,7 +18,7 @@ Torznab indexer configuration.
 
 from __future__ import annotations
 
-from typing import Iterable, List, Literal, Optional, Set, Union
+from typing import ClassVar, Iterable, List, Literal, Optional, Set, Union
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import NonEmptyStr, Password
@@ -28,6 +28,17 @@ from ..util import NabCategory
 from .base import TorrentIndexer
 
 
+# Module-level encoder/decoder functions, so the remote map references
+# a single shared function object instead of allocating closures in the
+# class body (and to benefit from CPython's call-site specialisation).
+def _encode_categories(value: Iterable[Union[NabCategory, int]]) -> List[int]:
+    return sorted(NabCategory.encode(category) for category in value)
+
+
+def _decode_additional_parameters(value: str) -> Optional[str]:
+    return value or None
+
+
 class TorznabIndexer(TorrentIndexer):
     # Monitor and search for new releases on a Torznab-compliant torrent indexing site.
 
@@ -88,21 +99,21 @@ class TorznabIndexer(TorrentIndexer):
     Additional Torznab API parameters.
     """
 
-    _implementation = "Torznab"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "Torznab"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("base_url", "baseUrl", {"is_field": True}),
         ("api_path", "apiPath", {"is_field": True}),
         ("api_key", "apiKey", {"is_field": True}),
         (
             "categories",
             "categories",
-            {"is_field": True, "encoder": lambda v: sorted(NabCategory.encode(c) for c in v)},
+            {"is_field": True, "encoder": _encode_categories},
         ),
         ("remove_year", "removeYear", {"is_field": True}),
         (
             "additional_parameters",
             "additionalParameters",
-            {"is_field": True, "field_default": None, "decoder": lambda v: v or None},
+            {"is_field": True, "field_default": None, "decoder": _decode_additional_parameters},
         ),
     ]
 
@@ -111,6 +122,10 @@ class TorznabIndexer(TorrentIndexer):
         cls,
         value: Iterable[Union[NabCategory, int]],
     ) -> Set[Union[NabCategory, int]]:
+        # Skip rebuilding the set when all values are already decoded
+        # (the common case when revalidating an already-parsed configuration).
+        if isinstance(value, set) and all(isinstance(category, NabCategory) for category in value):
+            return value
         return set(
             NabCategory.decode(category) if isinstance(category, int) else category
             for category in value
@@ -18,7 +18,7 @@ Newznab indexer configuration.
 
 from __future__ import annotations
 
-from typing import List, Literal
+from typing import ClassVar, List, Literal
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import RssUrl
@@ -47,10 +47,10 @@ class FanzubIndexer(UsenetIndexer):
     Only applies for Anime series types.
     """
 
-    _implementation = "Fanzub"
-    _implementation_name = "Fanzub"
-    _config_contract = "FanzubSettings"
-    _remote_map: List[RemoteMapEntry] = [
+    _implementation: ClassVar[str] = "Fanzub"
+    _implementation_name: ClassVar[str] = "Fanzub"
+    _config_contract: ClassVar[str] = "FanzubSettings"
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("rss_url", "rssUrl", {"is_field": True}),
         ("anime_standard_format_search", "animeStandardFormatSearch", {"is_field": True}),
     ]
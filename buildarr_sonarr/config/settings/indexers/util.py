@@ -18,18 +18,15 @@ Indexer configuration utility classes and functions.
 
 from __future__ import annotations
 
-from logging import getLogger
 from typing import TYPE_CHECKING, cast
 
 from buildarr.types import BaseEnum
 
 if TYPE_CHECKING:
-    from typing import Union
+    from typing import Dict, Union
 
     from typing_extensions import Self
 
-logger = getLogger(__name__)
-
 
 class NabCategory(BaseEnum):
     # https://github.com/Prowlarr/Prowlarr/blob/develop/src/NzbDrone.Core/Indexers/NewznabStandardCategory.cs
@@ -47,14 +44,24 @@ class NabCategory(BaseEnum):
 
     @classmethod
     def decode(cls, value: int) -> Union[Self, int]:
-        try:
-            return cls(value)
-        except ValueError:
-            return value
+        return _NAB_CATEGORY_DECODE.get(value, value)
 
     @classmethod
     def encode(cls, value: Union[Self, int]) -> int:
-        return value if isinstance(value, int) else cast(int, value.value)
+        return value if isinstance(value, int) else _NAB_CATEGORY_ENCODE[value]
+
+
+# Precomputed encode/decode lookup tables for Newznab categories.
+# Enumeration value resolution scans the member aliases on every call,
+# and the remote map encoders run it for every category of every
+# Newznab/Torznab indexer during a sync, so resolve the closed set of
+# values once at import time and make encode/decode plain dict lookups.
+_NAB_CATEGORY_DECODE: Dict[Union[int, str], NabCategory] = {
+    value: category for category in NabCategory for value in category.values
+}
+_NAB_CATEGORY_ENCODE: Dict[NabCategory, int] = {
+    category: cast(int, category.value) for category in NabCategory
+}
 
 
 class FilelistCategory(BaseEnum):
@@ -18,7 +18,6 @@ Sonarr plugin import list settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
 from typing import Dict, List, Union
 
 import sonarr
@@ -28,6 +27,7 @@ from buildarr.types import BaseEnum
 from pydantic import Field
 from typing_extensions import Annotated, Self
 
+from ...._logging import logger
 from ....api import sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
@@ -39,8 +39,6 @@ from .trakt.list import TraktListImportList
 from .trakt.popular_list import TraktPopularListImportList
 from .trakt.user import TraktUserImportList
 
-logger = getLogger(__name__)
-
 IMPORTLIST_TYPE_MAP = {
     importlist_type._implementation: importlist_type  # type: ignore[attr-defined]
     for importlist_type in (
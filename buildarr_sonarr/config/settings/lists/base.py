@@ -18,7 +18,6 @@ Import list settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
 from typing import Any, Dict, Iterable, List, Mapping, Set
 
 import sonarr
@@ -31,8 +30,6 @@ from ....api import sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
 
-logger = getLogger(__name__)
-
 
 class Monitor(BaseEnum):
     all_episodes = "allEpisodes"
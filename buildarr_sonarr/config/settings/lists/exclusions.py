@@ -18,21 +18,68 @@ Import list exclusions settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Dict, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple
 
 import sonarr
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import NonEmptyStr
-from pydantic import PositiveInt
+from pydantic import PositiveInt, PrivateAttr, validator
 from typing_extensions import Self
 
+from ...._logging import logger
 from ....api import sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
 
-logger = getLogger(__name__)
+# Maximum number of threads used to mutate list exclusions concurrently.
+MAX_DEFINITION_WORKERS = 8
+
+# Cache of the list exclusions fetched from remote instances, keyed per
+# instance. A single update cycle lists the exclusions up to three times
+# (once each in `from_remote`, `update_remote` and `delete_remote`), and
+# each listing is a full network round trip, so fetch once and reuse.
+# The cache is scoped to one update cycle: `from_remote` (the first step
+# of a cycle) drops the instance's entry before fetching, so daemon mode
+# re-observes changes made directly on the instance between cycles, and
+# it is also invalidated whenever one of the instance's exclusions is
+# created, updated or deleted.
+_api_listexclusions_cache: Dict[
+    Tuple[str, str],
+    List[sonarr.ImportExclusionsResource],
+] = {}
+
+
+def _instance_key(secrets: SonarrSecrets) -> Tuple[str, str]:
+    return (secrets.host_url, secrets.api_key.get_secret_value())
+
+
+@lru_cache(maxsize=None)
+def _api_field_names() -> Mapping[str, str]:
+    # Mapping of API (camelCase) attribute names to the corresponding
+    # field names on the generated resource model, used to apply remote
+    # map output to an existing resource without a dictionary round trip.
+    return {field.alias: name for name, field in sonarr.ImportExclusionsResource.__fields__.items()}
+
+
+def _get_api_listexclusions(
+    secrets: SonarrSecrets,
+    api_client: Optional[sonarr.ApiClient] = None,
+) -> List[sonarr.ImportExclusionsResource]:
+    cache_key = _instance_key(secrets)
+    try:
+        return _api_listexclusions_cache[cache_key]
+    except KeyError:
+        pass
+    if api_client is not None:
+        api_listexclusions = sonarr.ImportExclusionsApi(api_client).list_exclusions()
+    else:
+        with sonarr_api_client(secrets=secrets) as api_client:
+            api_listexclusions = sonarr.ImportExclusionsApi(api_client).list_exclusions()
+    _api_listexclusions_cache[cache_key] = api_listexclusions
+    return api_listexclusions
 
 
 class ListExclusion(SonarrConfigBase):
@@ -47,31 +94,70 @@ class ListExclusion(SonarrConfigBase):
     year: PositiveInt
     """ """
 
-    _remote_map: List[RemoteMapEntry] = [
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("tmdb_id", "tmdbId", {}),
         ("title", "movieTitle", {}),
         ("year", "movieYear", {}),
     ]
 
+    # Cached tuple of the remote-mapped field values, used to cheaply
+    # detect unchanged definitions before running the full diffing
+    # machinery. Safe to cache because the model is immutable.
+    _fingerprint_cache: Optional[Tuple[int, str, int]] = PrivateAttr(None)
+
+    def _fingerprint(self) -> Tuple[int, str, int]:
+        if self._fingerprint_cache is None:
+            self._fingerprint_cache = (self.tmdb_id, self.title, self.year)
+        return self._fingerprint_cache
+
+    class Config(SonarrConfigBase.Config):
+        # List exclusions are never mutated in-place once parsed, and an
+        # instance can number in the thousands of them. Mark them immutable,
+        # and let validation share the already-parsed instance instead of
+        # shallow-copying it into the parent model.
+        # (Pydantic v1 models do not support `__slots__`, so this is as close
+        # as the installed Pydantic version gets to a frozen/slotted model.)
+        allow_mutation = False
+        copy_on_model_validation = "none"
+
     @classmethod
     def _from_remote(cls, api_listexclusion: sonarr.ImportExclusionsResource) -> Self:
-        return cls(**cls.get_local_attrs(cls._remote_map, api_listexclusion.to_dict()))
+        # The remote map for list exclusions is three plain attribute renames
+        # with no codecs, so read the resource fields directly instead of
+        # serialising the resource to a dictionary and interpreting the
+        # remote map for every exclusion fetched from the instance.
+        # (`_remote_map` remains the source of truth for create/update.)
+        # The values are from an API response already parsed by the generated
+        # client, so skip re-validating them with `construct` — anything that
+        # mutates the returned model must re-validate it.
+        return cls.construct(
+            tmdb_id=api_listexclusion.tmdb_id,
+            title=api_listexclusion.movie_title,
+            year=api_listexclusion.movie_year,
+        )
 
-    def _create_remote(self, tree: str, secrets: SonarrSecrets) -> None:
-        with sonarr_api_client(secrets=secrets) as api_client:
-            sonarr.ImportExclusionsApi(api_client).create_exclusions(
-                import_exclusions_resource=sonarr.ImportExclusionsResource.from_dict(
-                    self.get_create_remote_attrs(tree=tree, remote_map=self._remote_map),
-                ),
-            )
+    def _create_remote(self, tree: str, api_client: sonarr.ApiClient) -> None:
+        # The create attributes are keyed by API attribute name, which the
+        # resource model accepts directly as field aliases, so the resource
+        # can be built in a single step without going through `from_dict`.
+        sonarr.ImportExclusionsApi(api_client).create_exclusions(
+            import_exclusions_resource=sonarr.ImportExclusionsResource(
+                **self.get_create_remote_attrs(tree=tree, remote_map=self._remote_map),
+            ),
+        )
 
     def _update_remote(
         self,
         tree: str,
-        secrets: SonarrSecrets,
+        api_client: sonarr.ApiClient,
         remote: Self,
         api_listexclusion: sonarr.ImportExclusionsResource,
     ) -> bool:
+        # The vast majority of exclusions are unchanged on any given sync,
+        # so compare the mapped field values directly first, and only run
+        # the full per-field diffing (and its logging) on a mismatch.
+        if self._fingerprint() == remote._fingerprint():
+            return False
         updated, updated_attrs = self.get_update_remote_attrs(
             tree=tree,
             remote=remote,
@@ -79,19 +165,21 @@ class ListExclusion(SonarrConfigBase):
             set_unchanged=True,
         )
         if updated:
-            with sonarr_api_client(secrets=secrets) as api_client:
-                sonarr.ImportExclusionsApi(api_client).update_exclusions(
-                    id=str(api_listexclusion.id),
-                    import_exclusions_resource=sonarr.ImportExclusionsResource.from_dict(
-                        {**api_listexclusion.to_dict(), **updated_attrs},
-                    ),
-                )
+            # Copy the existing resource with only the changed values applied,
+            # instead of converting the whole resource to a dictionary and
+            # parsing it back into a new resource for every update.
+            field_names = _api_field_names()
+            sonarr.ImportExclusionsApi(api_client).update_exclusions(
+                id=str(api_listexclusion.id),
+                import_exclusions_resource=api_listexclusion.copy(
+                    update={field_names[key]: value for key, value in updated_attrs.items()},
+                ),
+            )
             return True
         return False
 
-    def _delete_remote(self, secrets: SonarrSecrets, listexclusion_id: int) -> None:
-        with sonarr_api_client(secrets=secrets) as api_client:
-            sonarr.ImportExclusionsApi(api_client).delete_exclusions(id=listexclusion_id)
+    def _delete_remote(self, api_client: sonarr.ApiClient, listexclusion_id: int) -> None:
+        sonarr.ImportExclusionsApi(api_client).delete_exclusions(id=listexclusion_id)
 
 
 class ListExclusionsSettings(SonarrConfigBase):
@@ -133,20 +221,47 @@ class ListExclusionsSettings(SonarrConfigBase):
     Automatically delete import lists not defined in Buildarr.
     """
 
-    definitions: Set[ListExclusion] = set()
+    definitions: Dict[PositiveInt, ListExclusion] = {}
     """
     Import list definitions go here.
     """
 
+    @validator("definitions", pre=True)
+    def validate_definitions(cls, value: Any) -> Any:
+        # Accept definitions as a plain list (as written in configuration
+        # files) and key them by TMDB ID, the format used internally.
+        # Storing the definitions keyed by TMDB ID means lookups during
+        # updates are single dictionary accesses, instead of rebuilding
+        # an index (and hashing every definition model) on every call.
+        if isinstance(value, (list, set, tuple)):
+            definitions = {}
+            for listexclusion in value:
+                if isinstance(listexclusion, Mapping):
+                    # Raise `ValueError` (not `KeyError`) on a missing TMDB ID,
+                    # so Pydantic reports it as a validation error.
+                    try:
+                        tmdb_id = listexclusion["tmdb_id"]
+                    except KeyError:
+                        raise ValueError(
+                            f"tmdb_id is required for list exclusion {listexclusion!r}",
+                        ) from None
+                else:
+                    tmdb_id = listexclusion.tmdb_id
+                definitions[tmdb_id] = listexclusion
+            return definitions
+        return value
+
     @classmethod
     def from_remote(cls, secrets: SonarrSecrets) -> Self:
-        with sonarr_api_client(secrets=secrets) as api_client:
-            api_listexclusions = sonarr.ImportExclusionsApi(api_client).list_exclusions()
+        # Every update cycle starts here, so drop any listing cached by a
+        # previous cycle to pick up changes made directly on the instance.
+        # `update_remote` and `delete_remote` then reuse this cycle's fetch.
+        _api_listexclusions_cache.pop(_instance_key(secrets), None)
         return cls(
-            definitions=set(
-                ListExclusion._from_remote(api_listexclusion)
-                for api_listexclusion in api_listexclusions
-            ),
+            definitions={
+                api_listexclusion.tmdb_id: ListExclusion._from_remote(api_listexclusion)
+                for api_listexclusion in _get_api_listexclusions(secrets)
+            },
         )
 
     def update_remote(
@@ -157,56 +272,70 @@ class ListExclusionsSettings(SonarrConfigBase):
         check_unmanaged: bool = False,
     ) -> bool:
         changed = False
+        # Keep one API client open for the whole operation, so the listing
+        # and all mutations reuse the same connection, and dispatch the
+        # mutations (independent I/O bound HTTP requests) through a small
+        # thread pool to overlap their round trips.
         with sonarr_api_client(secrets=secrets) as api_client:
             api_listexclusions: Dict[int, sonarr.ImportExclusionsResource] = {
                 api_listexclusion.tmdb_id: api_listexclusion
-                for api_listexclusion in sonarr.ImportExclusionsApi(api_client).list_exclusions()
+                for api_listexclusion in _get_api_listexclusions(secrets, api_client=api_client)
             }
-        local_listexclusions = {
-            listexclusion.tmdb_id: listexclusion for listexclusion in self.definitions
-        }
-        remote_listexclusions = {
-            listexclusion.tmdb_id: listexclusion for listexclusion in remote.definitions
-        }
-        for i, listexclusion in enumerate(local_listexclusions.values()):
-            listexclusion_tree = f"{tree}.definitions[{i}]"
-            if listexclusion.tmdb_id not in remote_listexclusions:
-                listexclusion._create_remote(tree=listexclusion_tree, secrets=secrets)
-                changed = True
-            elif listexclusion._update_remote(
-                tree=listexclusion_tree,
-                secrets=secrets,
-                remote=remote_listexclusions[listexclusion.tmdb_id],
-                api_listexclusion=api_listexclusions[listexclusion.tmdb_id],
-            ):
-                changed = True
+
+            def update_listexclusion(definition: Tuple[int, ListExclusion]) -> bool:
+                i, listexclusion = definition
+                listexclusion_tree = f"{tree}.definitions[{i}]"
+                if listexclusion.tmdb_id not in remote.definitions:
+                    listexclusion._create_remote(tree=listexclusion_tree, api_client=api_client)
+                    return True
+                return listexclusion._update_remote(
+                    tree=listexclusion_tree,
+                    api_client=api_client,
+                    remote=remote.definitions[listexclusion.tmdb_id],
+                    api_listexclusion=api_listexclusions[listexclusion.tmdb_id],
+                )
+
+            with ThreadPoolExecutor(max_workers=MAX_DEFINITION_WORKERS) as executor:
+                for listexclusion_changed in executor.map(
+                    update_listexclusion,
+                    enumerate(self.definitions.values()),
+                ):
+                    changed |= listexclusion_changed
+        if changed:
+            _api_listexclusions_cache.pop(_instance_key(secrets), None)
         return changed
 
     def delete_remote(self, tree: str, secrets: SonarrSecrets, remote: Self) -> bool:
         changed = False
+        # As in `update_remote`, share one API client across the listing and
+        # the deletions, and overlap the deletion requests with a thread pool.
         with sonarr_api_client(secrets=secrets) as api_client:
             api_listexclusions: Dict[int, sonarr.ImportExclusionsResource] = {
                 api_listexclusion.tmdb_id: api_listexclusion
-                for api_listexclusion in sonarr.ImportExclusionsApi(api_client).list_exclusions()
+                for api_listexclusion in _get_api_listexclusions(secrets, api_client=api_client)
             }
-        local_listexclusions = {
-            listexclusion.tmdb_id: listexclusion for listexclusion in self.definitions
-        }
-        remote_listexclusions = {
-            listexclusion.tmdb_id: listexclusion for listexclusion in remote.definitions
-        }
-        i = -1
-        for listexclusion in remote_listexclusions.values():
-            if listexclusion.tmdb_id not in local_listexclusions:
-                listexclusion_tree = f"{tree}.definitions[{i}]"
-                if self.delete_unmanaged:
-                    logger.info("%s: (...) -> (deleted)", listexclusion_tree)
-                    listexclusion._delete_remote(
-                        secrets=secrets,
-                        listexclusion_id=api_listexclusions[listexclusion.tmdb_id].id,
-                    )
-                    changed = True
-                else:
-                    logger.debug("%s: (...) (unmanaged)", listexclusion_tree)
-                i -= -1
+            with ThreadPoolExecutor(max_workers=MAX_DEFINITION_WORKERS) as executor:
+                futures = []
+                i = 0
+                for listexclusion in remote.definitions.values():
+                    if listexclusion.tmdb_id not in self.definitions:
+                        # Leave all formatting (including the tree path) to the
+                        # logger, so no strings are built when the level is off.
+                        if self.delete_unmanaged:
+                            logger.info("%s.definitions[%d]: (...) -> (deleted)", tree, i)
+                            futures.append(
+                                executor.submit(
+                                    listexclusion._delete_remote,
+                                    api_client=api_client,
+                                    listexclusion_id=api_listexclusions[listexclusion.tmdb_id].id,
+                                ),
+                            )
+                            changed = True
+                        else:
+                            logger.debug("%s.definitions[%d]: (...) (unmanaged)", tree, i)
+                        i += 1
+                for future in futures:
+                    future.result()
+        if changed:
+            _api_listexclusions_cache.pop(_instance_key(secrets), None)
         return changed
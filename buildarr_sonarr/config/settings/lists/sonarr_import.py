@@ -18,7 +18,6 @@ Sonarr import list configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
 from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Set, Union, cast
 
 from buildarr.config import RemoteMapEntry
@@ -27,12 +26,11 @@ from buildarr.types import InstanceName, NonEmptyStr
 from pydantic import AnyHttpUrl, Field, PositiveInt, SecretStr, validator
 from typing_extensions import Self
 
+from ...._logging import logger
 from ....api import api_get
 from ....secrets import SonarrSecrets
 from .base import ImportList
 
-logger = getLogger(__name__)
-
 
 class SonarrImportList(ImportList):
     """
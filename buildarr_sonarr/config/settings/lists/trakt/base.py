@@ -21,7 +21,6 @@ from __future__ import annotations
 import re
 
 from datetime import datetime
-from logging import getLogger
 from typing import (
     List,
     Mapping,
@@ -36,8 +35,6 @@ from pydantic import ConstrainedStr, PositiveInt
 from ....util import trakt_expires_encoder
 from ..base import ImportList
 
-logger = getLogger(__name__)
-
 
 class YearRange(ConstrainedStr):
     """
@@ -18,11 +18,17 @@ Profiles settings configuration.
 
 from __future__ import annotations
 
+from pydantic import Field
+
 from ...types import SonarrConfigBase
 from .delay_profiles import SonarrDelayProfilesSettings
 from .quality_profiles import SonarrQualityProfilesSettings
 
 
 class SonarrProfilesSettings(SonarrConfigBase):
-    quality_profiles: SonarrQualityProfilesSettings = SonarrQualityProfilesSettings()
-    delay_profiles: SonarrDelayProfilesSettings = SonarrDelayProfilesSettings()
+    quality_profiles: SonarrQualityProfilesSettings = Field(
+        default_factory=SonarrQualityProfilesSettings,
+    )
+    delay_profiles: SonarrDelayProfilesSettings = Field(
+        default_factory=SonarrDelayProfilesSettings,
+    )
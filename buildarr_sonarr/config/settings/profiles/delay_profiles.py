@@ -18,7 +18,6 @@ Delay profiles settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
 from typing import Any, Dict, List, Mapping, Set
 
 import sonarr
@@ -28,12 +27,11 @@ from buildarr.types import BaseEnum, NonEmptyStr
 from pydantic import Field
 from typing_extensions import Self
 
+from ...._logging import logger
 from ....api import sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
 
-logger = getLogger(__name__)
-
 
 class PreferredProtocol(BaseEnum):
     """
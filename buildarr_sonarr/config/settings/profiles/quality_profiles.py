@@ -18,7 +18,6 @@ Quality profiles settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Set, Union, cast
 
 import sonarr
@@ -28,6 +27,7 @@ from buildarr.types import NonEmptyStr
 from pydantic import Field, validator
 from typing_extensions import Annotated, Self
 
+from ...._logging import logger
 from ....api import sonarr_api_client
 from ....secrets import SonarrSecrets
 from ...types import SonarrConfigBase
@@ -36,8 +36,6 @@ from ...util import language_parse
 if TYPE_CHECKING:
     from ..custom_formats.custom_format import CustomFormat
 
-logger = getLogger(__name__)
-
 
 class QualityGroup(SonarrConfigBase):
     name: NonEmptyStr
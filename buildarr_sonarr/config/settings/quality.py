@@ -18,8 +18,6 @@ Quality settings configuration.
 
 from __future__ import annotations
 
-import json
-
 from typing import Any, Dict, Mapping, Optional, cast
 
 import sonarr
@@ -32,6 +30,7 @@ from typing_extensions import Self
 
 from ...api import sonarr_api_client
 from ...secrets import SonarrSecrets
+from ...util import load_json_file
 from ..types import SonarrConfigBase
 
 QUALITYDEFINITION_MIN_MAX = 398
@@ -179,19 +178,18 @@ class SonarrQualitySettings(SonarrConfigBase):
         for quality_file in (
             state.trash_metadata_dir / "docs" / "json" / "sonarr" / "quality-size"
         ).iterdir():
-            with quality_file.open() as f:
-                quality_json = json.load(f)
-                if cast(str, quality_json["trash_id"]).lower() == self.trash_id:
-                    for definition_json in quality_json["qualities"]:
-                        definition_name = definition_json["quality"]
-                        if definition_name not in self.definitions:
-                            self.definitions[definition_name] = QualityDefinition(
-                                title=None,
-                                min=definition_json["min"],
-                                preferred=definition_json["preferred"],
-                                max=definition_json["max"],
-                            )
-                    return
+            quality_json = load_json_file(quality_file)
+            if cast(str, quality_json["trash_id"]).lower() == self.trash_id:
+                for definition_json in quality_json["qualities"]:
+                    definition_name = definition_json["quality"]
+                    if definition_name not in self.definitions:
+                        self.definitions[definition_name] = QualityDefinition(
+                            title=None,
+                            min=definition_json["min"],
+                            preferred=definition_json["preferred"],
+                            max=definition_json["max"],
+                        )
+                return
         raise ConfigTrashIDNotFoundError(
             f"Unable to find Sonarr quality definition file with trash ID '{self.trash_id}'",
         )
@@ -18,19 +18,22 @@ Tags settings configuration.
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Dict, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet
 
 import sonarr
 
 from buildarr.types import NonEmptyStr
+from pydantic import Field
 from typing_extensions import Self
 
+from ..._logging import logger
 from ...api import sonarr_api_client
 from ...secrets import SonarrSecrets
 from ..types import SonarrConfigBase
 
-logger = getLogger(__name__)
+# Maximum number of threads used to create tags concurrently.
+MAX_DEFINITION_WORKERS = 8
 
 
 class SonarrTagsSettings(SonarrConfigBase):
@@ -50,7 +53,7 @@ class SonarrTagsSettings(SonarrConfigBase):
     in this configuration section.
     """
 
-    definitions: Set[NonEmptyStr] = set()
+    definitions: FrozenSet[NonEmptyStr] = Field(default_factory=frozenset)
     """
     Define tags that are used within Buildarr here.
 
@@ -64,7 +67,10 @@ class SonarrTagsSettings(SonarrConfigBase):
     def from_remote(cls, secrets: SonarrSecrets) -> Self:
         with sonarr_api_client(secrets=secrets) as api_client:
             tags = sonarr.TagApi(api_client).list_tag()
-        return cls(definitions=set([tag.label for tag in tags]))
+        # The labels are from an API response already parsed by the generated
+        # client, so skip re-validating them with `construct` — anything that
+        # mutates the returned model must re-validate it.
+        return cls.construct(definitions=frozenset(tag.label for tag in tags))
 
     def update_remote(
         self,
@@ -79,11 +85,28 @@ class SonarrTagsSettings(SonarrConfigBase):
             tag_api = sonarr.TagApi(api_client)
             current_tags: Dict[str, int] = {tag.label: tag.id for tag in tag_api.list_tag()}
             if self.definitions:
-                for i, tag in enumerate(self.definitions):
-                    if tag in current_tags:
-                        logger.debug("%s.definitions[%i]: %s (exists)", tree, i, repr(tag))
-                    else:
-                        logger.info("%s.definitions[%i]: %s -> (created)", tree, i, repr(tag))
+                # Diff the definitions against the remote tags as set
+                # operations, and only log (and act) on the deltas, instead of
+                # formatting a log line for every tag on every update cycle.
+                missing = self.definitions - current_tags.keys()
+                logger.debug(
+                    "%s.definitions: %d existing, %d to create",
+                    tree,
+                    len(self.definitions) - len(missing),
+                    len(missing),
+                )
+                if missing:
+                    for tag in missing:
+                        logger.info("%s.definitions: %r -> (created)", tree, tag)
+
+                    # Tag creations are independent requests, so dispatch them
+                    # through a small thread pool to overlap the round trips,
+                    # instead of performing one round trip per tag serially.
+                    def create_tag(tag: str) -> None:
                         tag_api.create_tag(sonarr.TagResource(label=tag))
-                        changed = True
+
+                    with ThreadPoolExecutor(max_workers=MAX_DEFINITION_WORKERS) as executor:
+                        for _ in executor.map(create_tag, missing):
+                            pass
+                    changed = True
         return changed
@@ -18,13 +18,38 @@ Buildarr plugin interface.
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import Any, Optional, Type
+
 from buildarr.plugins import Plugin
 
 from . import __version__
-from .cli import sonarr
-from .config import SonarrConfig
-from .manager import SonarrManager
-from .secrets import SonarrSecrets
+
+
+class _LazyImport:
+    """
+    Descriptor that imports a plugin attribute on first access.
+
+    Buildarr imports this module for every run (the plugin entry point
+    resolves to `SonarrPlugin`), but most attributes pull in the
+    configuration models and the Sonarr API client — a large import
+    chain that is wasted work whenever this plugin is not actually used.
+    Defer those imports until the attribute is read, then replace the
+    descriptor with the imported object so later reads are plain
+    attribute accesses.
+    """
+
+    def __init__(self, module_name: str, attr_name: str) -> None:
+        self.module_name = module_name
+        self.attr_name = attr_name
+
+    def __set_name__(self, owner: Type[Plugin], name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Optional[Plugin], objtype: Optional[Type[Plugin]] = None) -> Any:
+        value = getattr(import_module(self.module_name, package=__package__), self.attr_name)
+        setattr(objtype if objtype is not None else type(obj), self.name, value)
+        return value
 
 
 class SonarrPlugin(Plugin):
@@ -32,8 +57,8 @@ class SonarrPlugin(Plugin):
     Plugin class that Buildarr reads to process Sonarr instances.
     """
 
-    cli = sonarr
-    config = SonarrConfig
-    manager = SonarrManager
-    secrets = SonarrSecrets
+    cli = _LazyImport(".cli", "sonarr")
+    config = _LazyImport(".config", "SonarrConfig")
+    manager = _LazyImport(".manager", "SonarrManager")
+    secrets = _LazyImport(".secrets", "SonarrSecrets")
     version = __version__
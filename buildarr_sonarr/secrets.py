@@ -19,13 +19,14 @@ Plugin secrets file model.
 from __future__ import annotations
 
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Optional, cast
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, cast
 
 import sonarr
 
 from buildarr.secrets import SecretsPlugin
 from buildarr.types import NonEmptyStr, Port
-from pydantic import validator
+from pydantic import PrivateAttr, validator
 from sonarr.exceptions import UnauthorizedException
 
 from .api import api_get, sonarr_api_client
@@ -44,6 +45,17 @@ else:
     class _SonarrSecrets(SecretsPlugin): ...
 
 
+# Cache of instance versions, keyed per instance (host URL and API key).
+# Fetching the secrets normally performs a system status round trip purely
+# to determine the version, on every single secrets fetch. A successful
+# fetch proves the API key works, so reuse its result for subsequent
+# fetches of the same instance. Entries expire after an hour so that
+# long-lived daemon runs still notice instance upgrades, and are evicted
+# if the API key stops being accepted.
+_VERSION_CACHE_TTL = 3600.0
+_version_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+
 class SonarrSecrets(_SonarrSecrets):
     """
     Sonarr API secrets.
@@ -56,14 +68,21 @@ class SonarrSecrets(_SonarrSecrets):
     api_key: ArrApiKey
     version: NonEmptyStr
 
+    # Cached host URL for this secrets object. The host URL is read by
+    # every API call site (and by the per-instance caches that key on it),
+    # so format it once on first access instead of on every read.
+    _host_url: Optional[str] = PrivateAttr(None)
+
     @property
     def host_url(self) -> str:
-        return self._get_host_url(
-            protocol=self.protocol,
-            hostname=self.hostname,
-            port=self.port,
-            url_base=self.url_base,
-        )
+        if self._host_url is None:
+            self._host_url = self._get_host_url(
+                protocol=self.protocol,
+                hostname=self.hostname,
+                port=self.port,
+                url_base=self.url_base,
+            )
+        return self._host_url
 
     @validator("url_base")
     def validate_url_base(cls, value: Optional[str]) -> Optional[str]:
@@ -124,10 +143,27 @@ class SonarrSecrets(_SonarrSecrets):
                     raise
             else:
                 api_key = initialize_json["apiKey"]
+        cache_key = (host_url, api_key)
+        cached = _version_cache.get(cache_key)
+        if cached is not None:
+            version, fetched_at = cached
+            if monotonic() - fetched_at < _VERSION_CACHE_TTL:
+                secrets = cls(
+                    hostname=cast(NonEmptyStr, hostname),
+                    port=cast(Port, port),
+                    protocol=cast(SonarrProtocol, protocol),
+                    url_base=url_base,
+                    api_key=cast(ArrApiKey, api_key),
+                    version=cast(NonEmptyStr, version),
+                )
+                secrets._host_url = host_url
+                return secrets
+            del _version_cache[cache_key]
         try:
             with sonarr_api_client(host_url=host_url, api_key=api_key) as api_client:
                 system_status = sonarr.SystemApi(api_client).get_system_status()
         except UnauthorizedException:
+            _version_cache.pop(cache_key, None)
             raise SonarrSecretsUnauthorizedError(
                 (
                     f"Incorrect API key for the Sonarr instance at '{host_url}'. "
@@ -136,7 +172,8 @@ class SonarrSecrets(_SonarrSecrets):
                     "'Settings -> General -> API Key' on the Sonarr instance."
                 ),
             ) from None
-        return cls(
+        _version_cache[cache_key] = (system_status.version, monotonic())
+        secrets = cls(
             hostname=cast(NonEmptyStr, hostname),
             port=cast(Port, port),
             protocol=cast(SonarrProtocol, protocol),
@@ -144,6 +181,9 @@ class SonarrSecrets(_SonarrSecrets):
             api_key=cast(ArrApiKey, api_key),
             version=system_status.version,
         )
+        # The host URL was already formatted above, so seed the cache with it.
+        secrets._host_url = host_url
+        return secrets
 
     def test(self) -> bool:
         # We already perform API requests as part of instantiating the secrets object.
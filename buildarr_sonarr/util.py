@@ -19,6 +19,18 @@ Plugin utility classes and functions.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+try:
+    # Use orjson to parse JSON files when it is available in the environment.
+    # It is considerably faster than the standard library parser, which adds up
+    # when scanning the TRaSH-Guides metadata directories (hundreds of files).
+    # It is not a dependency of this plugin, so fall back to the standard
+    # library when it is not installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 def zulu_datetime_format(dt: datetime) -> str:
@@ -44,3 +56,19 @@ def zulu_datetime_format(dt: datetime) -> str:
         dt_aware = dt.replace(tzinfo=timezone.utc)
 
     return dt_aware.isoformat().replace("+00:00", "Z")
+
+
+def load_json_file(path: Path) -> Any:
+    """
+    Load and deserialise a JSON file from the given path.
+
+    Uses `orjson` if it is installed, otherwise the standard library parser.
+
+    Args:
+        path (Path): Path of the JSON file to load
+
+    Returns:
+        Deserialised JSON file contents
+    """
+
+    return _json_loads(path.read_bytes())
@@ -0,0 +1,76 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the combined remote map cache on the download client configuration base class.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from buildarr_sonarr.config.settings.download_clients import base
+from buildarr_sonarr.config.settings.download_clients.torrent.transmission import (
+    TransmissionDownloadClient,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_remote_map_cache():
+    """
+    Clear the remote map cache before and after each test.
+    """
+
+    base._remote_map_cache.clear()
+    yield
+    base._remote_map_cache.clear()
+
+
+def test_cached_for_same_tag_ids() -> None:
+    """
+    Test that the combined remote map is only built once per class
+    for a given tag ID mapping, and reused on subsequent calls.
+    """
+
+    tag_ids = {"shows": 1, "anime": 2}
+
+    remote_map = TransmissionDownloadClient._get_remote_map(tag_ids)
+
+    assert TransmissionDownloadClient._get_remote_map(tag_ids) is remote_map
+
+
+def test_combined_entries() -> None:
+    """
+    Test that the cached remote map combines the base class
+    and download client type-specific entries.
+    """
+
+    remote_attrs = {entry[0] for entry in TransmissionDownloadClient._get_remote_map({"shows": 1})}
+
+    assert {"enable", "remove_completed_downloads", "tags", "hostname", "port"} <= remote_attrs
+
+
+def test_replaced_when_tag_ids_change() -> None:
+    """
+    Test that when a new tag ID mapping is passed (as happens once per
+    update run), the cache entry for the class is replaced, rather than
+    a new entry being accumulated for every run.
+    """
+
+    for _ in range(5):
+        tag_ids = {"shows": 1, "anime": 2}
+        remote_map = TransmissionDownloadClient._get_remote_map(tag_ids)
+
+    assert len(base._remote_map_cache) == 1
+    assert base._remote_map_cache[TransmissionDownloadClient] == (tag_ids, remote_map)
@@ -0,0 +1,135 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `delete_remote` method on the List Exclusions Settings configuration model.
+
+The installed Sonarr API client does not provide the import list exclusions API,
+so these tests stub it out at the module level instead of using the API test server.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from buildarr_sonarr.config.settings.lists import exclusions
+
+
+@pytest.fixture(autouse=True)
+def stub_api(monkeypatch):
+    """
+    Stub out the import list exclusions API, and clear the listing cache
+    before and after each test.
+
+    Returns:
+        List of TMDB IDs of the exclusions deleted through the stub API
+    """
+
+    deleted_ids = []
+
+    class ImportExclusionsApi:
+        def __init__(self, api_client) -> None:
+            pass
+
+        def list_exclusions(self):
+            return [
+                SimpleNamespace(id=i, tmdb_id=tmdb_id)
+                for i, tmdb_id in enumerate([101, 102, 103], 1)
+            ]
+
+        def delete_exclusions(self, id) -> None:  # noqa: A002
+            deleted_ids.append(id)
+
+    @contextmanager
+    def sonarr_api_client(**kwargs):
+        yield object()
+
+    exclusions._api_listexclusions_cache.clear()
+    monkeypatch.setattr(
+        exclusions,
+        "sonarr",
+        SimpleNamespace(ImportExclusionsApi=ImportExclusionsApi),
+    )
+    monkeypatch.setattr(exclusions, "sonarr_api_client", sonarr_api_client)
+    yield deleted_ids
+    exclusions._api_listexclusions_cache.clear()
+
+
+@pytest.fixture
+def secrets():
+    """
+    Fixture for creating stub Sonarr instance secrets.
+
+    Returns:
+        Stub secrets object
+    """
+
+    return SimpleNamespace(
+        host_url="http://localhost:8989",
+        api_key=SimpleNamespace(get_secret_value=lambda: "0123456789abcdef0123456789abcdef"),
+    )
+
+
+def _listexclusion(tmdb_id: int) -> dict:
+    return {"tmdb_id": tmdb_id, "title": f"Series {tmdb_id}", "year": 2000 + tmdb_id}
+
+
+def test_unmanaged_numbering(stub_api, secrets, caplog) -> None:
+    """
+    Test that unmanaged exclusions are numbered sequentially from 0
+    in the log output, skipping locally managed exclusions.
+    """
+
+    caplog.set_level(logging.DEBUG, logger="buildarr_sonarr")
+
+    local = exclusions.ListExclusionsSettings(definitions=[_listexclusion(102)])
+    remote = exclusions.ListExclusionsSettings(
+        definitions=[_listexclusion(tmdb_id) for tmdb_id in (101, 102, 103)],
+    )
+
+    assert not local.delete_remote(tree="sonarr.import_lists", secrets=secrets, remote=remote)
+    assert not stub_api
+    assert [record.getMessage() for record in caplog.records] == [
+        "sonarr.import_lists.definitions[0]: (...) (unmanaged)",
+        "sonarr.import_lists.definitions[1]: (...) (unmanaged)",
+    ]
+
+
+def test_delete_unmanaged(stub_api, secrets, caplog) -> None:
+    """
+    Test that unmanaged exclusions are deleted (and numbered sequentially)
+    when `delete_unmanaged` is enabled.
+    """
+
+    caplog.set_level(logging.DEBUG, logger="buildarr_sonarr")
+
+    local = exclusions.ListExclusionsSettings(
+        definitions=[_listexclusion(102)],
+        delete_unmanaged=True,
+    )
+    remote = exclusions.ListExclusionsSettings(
+        definitions=[_listexclusion(tmdb_id) for tmdb_id in (101, 102, 103)],
+    )
+
+    assert local.delete_remote(tree="sonarr.import_lists", secrets=secrets, remote=remote)
+    assert sorted(stub_api) == [1, 3]
+    assert [record.getMessage() for record in caplog.records] == [
+        "sonarr.import_lists.definitions[0]: (...) -> (deleted)",
+        "sonarr.import_lists.definitions[1]: (...) -> (deleted)",
+    ]